@@ -91,7 +91,10 @@ DATABASES = {
 }
 
 GRAPHENE = {
-    "SCHEMA": "projects.schema.schema"
+    "SCHEMA": "projects.schema.schema",
+    "MIDDLEWARE": [
+        "projects.loaders.LoaderMiddleware",
+    ],
 }
 
 # Password validation
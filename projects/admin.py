@@ -1,8 +1,23 @@
 from django.contrib import admin
 from .models import Organization, Project, Task, TaskComment
 
-admin.site.register(Organization)
-admin.site.register(Project)
-admin.site.register(Task)
-admin.site.register(TaskComment)
 
+@admin.register(Project)
+class ProjectAdmin(admin.ModelAdmin):
+    list_display = ('name', 'organization', 'status', 'due_date')
+    list_select_related = ('organization',)
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ('title', 'project', 'status', 'assignee_email')
+    list_select_related = ('project',)
+
+
+@admin.register(TaskComment)
+class TaskCommentAdmin(admin.ModelAdmin):
+    list_display = ('author_email', 'task', 'timestamp')
+    list_select_related = ('task',)
+
+
+admin.site.register(Organization)
@@ -0,0 +1,77 @@
+"""Per-request batching for foreign-key lookups in the GraphQL schema.
+
+graphene's promise-based DataLoader is not resolved by the synchronous
+executor this project runs under, so these loaders batch by memoizing
+`in_bulk` fetches for the life of a request instead: the first resolver
+to miss a key fetches and caches the row, and every sibling resolver in
+the same request reuses it. A graphene middleware attaches one set of
+loaders to the request context so the cache never outlives the request.
+"""
+
+from .models import Organization, Project, Task
+
+
+class ModelByIdLoader:
+    """Caches `Model.objects.in_bulk` results keyed by primary key."""
+
+    model = None
+
+    def __init__(self):
+        self._cache = {}
+
+    def load(self, key):
+        if key not in self._cache:
+            self._cache[key] = self.model.objects.in_bulk([key]).get(key)
+        return self._cache[key]
+
+    def load_many(self, keys):
+        missing = [key for key in set(keys) if key not in self._cache]
+        if missing:
+            fetched = self.model.objects.in_bulk(missing)
+            for key in missing:
+                self._cache[key] = fetched.get(key)
+        return [self._cache[key] for key in keys]
+
+    def prime(self, instance):
+        self._cache.setdefault(instance.pk, instance)
+
+
+class OrganizationByIdLoader(ModelByIdLoader):
+    model = Organization
+
+
+class ProjectByIdLoader(ModelByIdLoader):
+    model = Project
+
+
+class TaskByIdLoader(ModelByIdLoader):
+    model = Task
+
+
+class Loaders:
+    def __init__(self):
+        self.organizations = OrganizationByIdLoader()
+        self.projects = ProjectByIdLoader()
+        self.tasks = TaskByIdLoader()
+
+
+def get_loaders(info):
+    """Return the request's loaders, creating them if no middleware ran."""
+    loaders = getattr(info.context, 'loaders', None)
+    if loaders is None:
+        loaders = Loaders()
+        if info.context is not None:
+            try:
+                info.context.loaders = loaders
+            except AttributeError:
+                pass
+    return loaders
+
+
+class LoaderMiddleware:
+    """Graphene middleware attaching fresh loaders to each request context."""
+
+    def resolve(self, next, root, info, **kwargs):
+        if info.context is not None and not hasattr(info.context, 'loaders'):
+            info.context.loaders = Loaders()
+        return next(root, info, **kwargs)
@@ -0,0 +1,29 @@
+from django.db import migrations
+
+
+def create_trigram_index(apps, schema_editor):
+    # pg_trgm is PostgreSQL-only; other backends keep the plain icontains path.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS proj_trgm_idx ON projects_project "
+        "USING gin (name gin_trgm_ops, description gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS proj_trgm_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_alter_organization_options_alter_project_options_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
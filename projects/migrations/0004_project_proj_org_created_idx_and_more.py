@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-08-26 06:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_project_trigram_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['organization', '-created_at'], name='proj_org_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', '-created_at'], name='task_proj_created_idx'),
+        ),
+    ]
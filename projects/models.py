@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from django.db import models
 from django.core.validators import EmailValidator
 from django.utils import timezone
@@ -62,19 +64,34 @@ class Project(models.Model):
         indexes = [
             models.Index(fields=['organization', 'status']),
             models.Index(fields=['status', 'due_date']),
+            models.Index(fields=['organization', '-created_at'], name='proj_org_created_idx'),
         ]
         verbose_name = 'Project'
         verbose_name_plural = 'Projects'
 
     def __str__(self):
-        return f"{self.name} ({self.organization.name})"
+        # Format the FK id rather than self.organization.name so stray
+        # __str__ calls (admin, logging, repr) never fire a hidden query.
+        return f"{self.name} (org #{self.organization_id})"
 
-    @property
+    @cached_property
     def task_count(self):
+        # Annotated by the GraphQL resolvers; fall back to counting the
+        # prefetched rows (no query) or to the database for plain instances.
+        total = getattr(self, '_total', None)
+        if total is not None:
+            return total
+        if 'tasks' in getattr(self, '_prefetched_objects_cache', {}):
+            return len(self.tasks.all())
         return self.tasks.count()
 
-    @property
+    @cached_property
     def completed_tasks_count(self):
+        done = getattr(self, '_done', None)
+        if done is not None:
+            return done
+        if 'tasks' in getattr(self, '_prefetched_objects_cache', {}):
+            return sum(1 for task in self.tasks.all() if task.status == 'DONE')
         return self.tasks.filter(status='DONE').count()
 
     @property
@@ -91,10 +108,19 @@ class Project(models.Model):
         return False
 
     def get_tasks_by_status(self):
+        if getattr(self, '_total', None) is not None:
+            return {
+                'todo': self._todo,
+                'in_progress': self._in_progress,
+                'done': self._done,
+            }
+        # One GROUP BY status query instead of a COUNT per bucket; order_by()
+        # clears the default ordering so created_at stays out of the grouping.
+        rows = dict(self.tasks.order_by().values_list('status').annotate(models.Count('id')))
         return {
-            'todo': self.tasks.filter(status='TODO').count(),
-            'in_progress': self.tasks.filter(status='IN_PROGRESS').count(),
-            'done': self.tasks.filter(status='DONE').count(),
+            'todo': rows.get('TODO', 0),
+            'in_progress': rows.get('IN_PROGRESS', 0),
+            'done': rows.get('DONE', 0),
         }
 
 
@@ -126,16 +152,18 @@ class Task(models.Model):
             models.Index(fields=['project', 'status']),
             models.Index(fields=['assignee_email', 'status']),
             models.Index(fields=['status', 'due_date']),
+            models.Index(fields=['project', '-created_at'], name='task_proj_created_idx'),
         ]
         verbose_name = 'Task'
         verbose_name_plural = 'Tasks'
 
     def __str__(self):
-        return f"{self.title} - {self.project.name}"
+        return f"{self.title} (project #{self.project_id})"
 
-    @property
+    @cached_property
     def comment_count(self):
-        return self.comments.count()
+        count = getattr(self, '_comment_count', None)
+        return count if count is not None else self.comments.count()
 
     @property
     def is_overdue(self):
@@ -143,7 +171,7 @@ class Task(models.Model):
             return self.due_date < timezone.now() and self.status != 'DONE'
         return False
 
-    @property
+    @cached_property
     def organization(self):
         return self.project.organization
 
@@ -169,8 +197,8 @@ class TaskComment(models.Model):
         verbose_name_plural = 'Task Comments'
 
     def __str__(self):
-        return f"Comment by {self.author_email} on {self.task.title}"
+        return f"Comment by {self.author_email} (task #{self.task_id})"
 
-    @property
+    @cached_property
     def organization(self):
         return self.task.project.organization
\ No newline at end of file
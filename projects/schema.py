@@ -1,11 +1,171 @@
+import base64
+import binascii
+
 import graphene
 from graphene_django import DjangoObjectType
 from .models import Organization, Project, Task, TaskComment, STATUS_CHOICES, TASK_STATUS_CHOICES
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
-from django.db import transaction
-from django.core.validators import validate_email
-from django.db.models import Q, Count, Case, When, IntegerField
+from django.db import IntegrityError, connection
+from django.core.validators import EmailValidator
+from django.db.models import Q, Count, Case, When, Value, Prefetch, IntegerField, BooleanField
+from django.utils import timezone
 from django.utils.text import slugify
+from .loaders import get_loaders
+
+# Shared validator instance so each mutation skips EmailValidator setup.
+_email_validator = EmailValidator()
+
+# Valid status values, computed once for O(1) membership checks in mutations.
+_PROJECT_STATUS_SET = frozenset(choice[0] for choice in STATUS_CHOICES)
+_TASK_STATUS_SET = frozenset(choice[0] for choice in TASK_STATUS_CHOICES)
+
+
+# ----------------------
+# Query Optimization Helpers
+# ----------------------
+def _flatten_selections(selections, fragments):
+    """Yield the field nodes in `selections`, expanding fragment spreads and
+    inline fragments so callers only ever see concrete fields."""
+    stack = list(selections)
+    while stack:
+        selection = stack.pop()
+        if selection.kind == 'field':
+            yield selection
+        elif selection.kind == 'fragment_spread':
+            fragment = fragments.get(selection.name.value)
+            if fragment is not None:
+                stack.extend(fragment.selection_set.selections)
+        elif selection.kind == 'inline_fragment':
+            stack.extend(selection.selection_set.selections)
+
+
+def _requested_fields(info):
+    """Field names the client selected under the current field."""
+    try:
+        selections = info.field_nodes[0].selection_set.selections
+    except (AttributeError, IndexError):
+        return set()
+    return {field.name.value for field in _flatten_selections(selections, info.fragments)}
+
+
+def _requested_subfields(info, field_name):
+    """Field names selected under `field_name` within the current field."""
+    try:
+        selections = info.field_nodes[0].selection_set.selections
+    except (AttributeError, IndexError):
+        return set()
+    for field in _flatten_selections(selections, info.fragments):
+        if field.name.value == field_name and field.selection_set:
+            return {
+                subfield.name.value
+                for subfield in _flatten_selections(field.selection_set.selections, info.fragments)
+            }
+    return set()
+
+
+def optimize(queryset, info, mapping, defer_unrequested=None):
+    """Attach only the select_related/prefetch_related the selection needs.
+
+    `mapping` maps a GraphQL field name to a ('select' | 'prefetch', relation)
+    pair; relations whose field was not requested are skipped entirely, so a
+    `{ id name }` query never joins or prefetches anything.
+
+    `defer_unrequested` maps a GraphQL field name to a heavy column (TEXT)
+    that is deferred when the client did not select it, keeping those bytes
+    off the wire on list queries.
+    """
+    requested = _requested_fields(info)
+    selects = []
+    prefetches = []
+    for field, (kind, relation) in mapping.items():
+        if field in requested:
+            (selects if kind == 'select' else prefetches).append(relation)
+    if selects:
+        queryset = queryset.select_related(*selects)
+    if prefetches:
+        queryset = queryset.prefetch_related(*dict.fromkeys(prefetches))
+    if defer_unrequested:
+        deferred = [column for field, column in defer_unrequested.items() if field not in requested]
+        if deferred:
+            queryset = queryset.defer(*deferred)
+    return queryset
+
+
+# Columns each nested task field reads beyond the always-fetched set
+# (id/project_id for prefetch matching, status/due_date for isOverdue and
+# Python-side counting). Fields mapped to () resolve from those or via
+# their own resolvers.
+_TASK_FIELD_COLUMNS = {
+    'id': (),
+    'project': (),
+    'organization': (),
+    'comments': (),
+    'commentCount': (),
+    'isOverdue': (),
+    'status': (),
+    'dueDate': (),
+    'title': ('title',),
+    'description': ('description',),
+    'assigneeEmail': ('assignee_email',),
+    'createdAt': ('created_at',),
+    'updatedAt': ('updated_at',),
+}
+
+
+def _tasks_prefetch(info):
+    """Build the tasks Prefetch trimmed to the columns the nested task
+    selection actually reads; unknown selections fetch full rows rather
+    than risk a deferred-load query per task."""
+    columns = {'id', 'project_id', 'status', 'due_date'}
+    for field in _requested_subfields(info, 'tasks'):
+        extra = _TASK_FIELD_COLUMNS.get(field)
+        if extra is None:
+            return Prefetch('tasks', queryset=Task.objects.all())
+        columns.update(extra)
+    return Prefetch('tasks', queryset=Task.objects.only(*columns))
+
+
+def stream(queryset, chunk_size=500):
+    """Serve list results from the database cursor in chunks.
+
+    iterator() skips the queryset result cache, capping resident memory on
+    large lists. Querysets carrying prefetch_related lookups are returned
+    as-is, since prefetching requires the full result set in memory anyway.
+    """
+    if getattr(queryset, '_prefetch_related_lookups', None):
+        return queryset
+    return queryset.iterator(chunk_size=chunk_size)
+
+
+def _decode_cursor(cursor):
+    """Decode a keyset cursor: base64 of '<created_at isoformat>|<id>'.
+
+    Clients build the cursor from the createdAt and id of the last row of
+    the previous page. Returns None for malformed cursors.
+    """
+    try:
+        created_at, pk = base64.b64decode(cursor.encode()).decode().split('|')
+        return created_at, int(pk)
+    except (ValueError, UnicodeDecodeError, binascii.Error):
+        return None
+
+
+def _paginate_by_created_at(queryset, first, after):
+    """Apply keyset pagination ordered by (-created_at, -id).
+
+    Unlike OFFSET, the cursor filter is a range condition the composite
+    (parent, -created_at) indexes can satisfy without scanning skipped rows.
+    """
+    decoded = _decode_cursor(after) if after else None
+    if decoded:
+        created_at, pk = decoded
+        queryset = queryset.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+        )
+    queryset = queryset.order_by('-created_at', '-id')
+    if first is not None:
+        queryset = queryset[:first]
+    return queryset
 
 
 # ----------------------
@@ -34,6 +194,16 @@ class StatusChoiceType(graphene.ObjectType):
     display = graphene.String()
 
 
+# The choice lists never change at runtime, so materialize them once instead
+# of rebuilding the objects on every request.
+_PROJECT_STATUS_CHOICE_OBJS = tuple(
+    StatusChoiceType(value=value, display=display) for value, display in STATUS_CHOICES
+)
+_TASK_STATUS_CHOICE_OBJS = tuple(
+    StatusChoiceType(value=value, display=display) for value, display in TASK_STATUS_CHOICES
+)
+
+
 # ----------------------
 # Enhanced GraphQL Types
 # ----------------------
@@ -46,13 +216,14 @@ class OrganizationType(DjangoObjectType):
         fields = "__all__"
 
     def resolve_project_count(self, info):
-        # Use related_name if defined in your Project model
-        return self.projects.count() if hasattr(self, "projects") else self.project_set.count()
+        # Prefer the value annotated in the query; fall back for single objects
+        # fetched without the annotation.
+        count = getattr(self, '_project_count', None)
+        return count if count is not None else self.projects.count()
 
     def resolve_active_projects_count(self, info):
-        if hasattr(self, "projects"):
-            return self.projects.filter(status="ACTIVE").count()
-        return self.project_set.filter(status="ACTIVE").count()
+        count = getattr(self, '_active_projects_count', None)
+        return count if count is not None else self.projects.filter(status="ACTIVE").count()
 
 
 class ProjectType(DjangoObjectType):
@@ -73,20 +244,30 @@ class ProjectType(DjangoObjectType):
         return self.completed_tasks_count
 
     def resolve_completion_percentage(self, info):
+        total = getattr(self, '_total', None)
+        if total is not None:
+            return round((self._done / total) * 100, 1) if total else 0
         return self.completion_percentage
 
     def resolve_is_overdue(self, info):
-        return self.is_overdue
+        overdue = getattr(self, '_is_overdue', None)
+        return overdue if overdue is not None else self.is_overdue
 
     def resolve_task_statistics(self, info):
-        stats = self.get_tasks_by_status()
-        total = sum(stats.values())
-        completion_percentage = (stats['done'] / total * 100) if total > 0 else 0
-        
+        # Annotated queries resolve entirely from scalars already in memory.
+        total = getattr(self, '_total', None)
+        if total is not None:
+            todo, in_progress, done = self._todo, self._in_progress, self._done
+        else:
+            stats = self.get_tasks_by_status()
+            todo, in_progress, done = stats['todo'], stats['in_progress'], stats['done']
+            total = todo + in_progress + done
+        completion_percentage = (done / total * 100) if total > 0 else 0
+
         return TaskStatisticsType(
-            todo_count=stats['todo'],
-            in_progress_count=stats['in_progress'],
-            done_count=stats['done'],
+            todo_count=todo,
+            in_progress_count=in_progress,
+            done_count=done,
             total_count=total,
             completion_percentage=round(completion_percentage, 1)
         )
@@ -105,10 +286,17 @@ class TaskType(DjangoObjectType):
         return self.comment_count
 
     def resolve_is_overdue(self, info):
-        return self.is_overdue
+        overdue = getattr(self, '_is_overdue', None)
+        return overdue if overdue is not None else self.is_overdue
 
     def resolve_organization(self, info):
-        return self.organization
+        # select_related may already have cached the chain; the loaders
+        # cover list shapes where it has not, without a query per task.
+        if 'project' in self._state.fields_cache:
+            return self.project.organization
+        loaders = get_loaders(info)
+        project = loaders.projects.load(self.project_id)
+        return loaders.organizations.load(project.organization_id)
 
 
 class TaskCommentType(DjangoObjectType):
@@ -119,7 +307,12 @@ class TaskCommentType(DjangoObjectType):
         fields = "__all__"
 
     def resolve_organization(self, info):
-        return self.organization
+        if 'task' in self._state.fields_cache:
+            return self.task.project.organization
+        loaders = get_loaders(info)
+        task = loaders.tasks.load(self.task_id)
+        project = loaders.projects.load(task.project_id)
+        return loaders.organizations.load(project.organization_id)
 
 
 # ----------------------
@@ -130,17 +323,21 @@ class Query(graphene.ObjectType):
     organizations = graphene.List(OrganizationType)
     organization = graphene.Field(OrganizationType, slug=graphene.String(required=True))
     projects = graphene.List(
-        ProjectType, 
+        ProjectType,
         organization_slug=graphene.String(required=False),
         status=graphene.String(),
-        search=graphene.String()
+        search=graphene.String(),
+        first=graphene.Int(),
+        after=graphene.String()
     )
     project = graphene.Field(ProjectType, id=graphene.Int(required=True))
     tasks = graphene.List(
-        TaskType, 
+        TaskType,
         project_id=graphene.Int(required=True),
         status=graphene.String(),
-        assignee_email=graphene.String()
+        assignee_email=graphene.String(),
+        first=graphene.Int(),
+        after=graphene.String()
     )
     task = graphene.Field(TaskType, id=graphene.Int(required=True))
     task_comments = graphene.List(TaskCommentType, task_id=graphene.Int(required=True))
@@ -156,17 +353,44 @@ class Query(graphene.ObjectType):
     task_status_choices = graphene.List(StatusChoiceType)
 
     def resolve_organizations(self, info):
-        return Organization.objects.all().prefetch_related('projects')
+        # Compute both counts in the list query itself instead of two extra
+        # COUNT queries per organization.
+        return optimize(Organization.objects.all(), info, {
+            'projects': ('prefetch', 'projects'),
+        }).annotate(
+            _project_count=Count('projects', distinct=True),
+            _active_projects_count=Count('projects', filter=Q(projects__status='ACTIVE'), distinct=True)
+        )
 
     def resolve_organization(self, info, slug):
         try:
-            return Organization.objects.get(slug=slug)
+            return Organization.objects.annotate(
+                _project_count=Count('projects', distinct=True),
+                _active_projects_count=Count('projects', filter=Q(projects__status='ACTIVE'), distinct=True)
+            ).get(slug=slug)
         except Organization.DoesNotExist:
             return None
 
-    def resolve_projects(self, info, organization_slug=None, status=None, search=None):
-        queryset = Project.objects.all().select_related('organization').prefetch_related('tasks')
-        
+    def resolve_projects(self, info, organization_slug=None, status=None, search=None, first=None, after=None):
+        # One COUNT(CASE WHEN ...) pass covers taskCount, completedTasksCount,
+        # completionPercentage and taskStatistics for every project in the list.
+        # Prefetched tasks carry only the columns the nested task selection
+        # reads, keeping the second query's payload small.
+        queryset = optimize(Project.objects.all(), info, {
+            'organization': ('select', 'organization'),
+            'tasks': ('prefetch', _tasks_prefetch(info)),
+        }, defer_unrequested={'description': 'description'}).annotate(
+            _todo=Count('tasks', filter=Q(tasks__status='TODO')),
+            _in_progress=Count('tasks', filter=Q(tasks__status='IN_PROGRESS')),
+            _done=Count('tasks', filter=Q(tasks__status='DONE')),
+            _total=Count('tasks'),
+            _is_overdue=Case(
+                When(Q(due_date__lt=timezone.now().date()) & ~Q(status='COMPLETED'), then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField()
+            )
+        )
+
         if organization_slug:
             queryset = queryset.filter(organization__slug=organization_slug)
 
@@ -174,81 +398,114 @@ class Query(graphene.ObjectType):
             queryset = queryset.filter(status=status)
 
         if search:
-            queryset = queryset.filter(
-                Q(name__icontains=search) | Q(description__icontains=search)
-            )
+            if connection.vendor == 'postgresql':
+                # Trigram similarity hits the pg_trgm GIN index instead of a
+                # sequential ILIKE '%...%' scan, and ranks by relevance.
+                from django.contrib.postgres.search import TrigramSimilarity
+
+                queryset = queryset.annotate(
+                    _similarity=TrigramSimilarity('name', search) + TrigramSimilarity('description', search)
+                ).filter(_similarity__gt=0.1).order_by('-_similarity')
+            else:
+                queryset = queryset.filter(
+                    Q(name__icontains=search) | Q(description__icontains=search)
+                )
 
-        return queryset
+        if first is not None or after:
+            queryset = _paginate_by_created_at(queryset, first, after)
+
+        return stream(queryset)
 
 
     def resolve_project(self, info, id):
         try:
-            return Project.objects.select_related('organization').prefetch_related('tasks').get(id=id)
+            return optimize(Project.objects.all(), info, {
+                'organization': ('select', 'organization'),
+                'tasks': ('prefetch', _tasks_prefetch(info)),
+            }).annotate(
+                _todo=Count('tasks', filter=Q(tasks__status='TODO')),
+                _in_progress=Count('tasks', filter=Q(tasks__status='IN_PROGRESS')),
+                _done=Count('tasks', filter=Q(tasks__status='DONE')),
+                _total=Count('tasks')
+            ).get(id=id)
         except Project.DoesNotExist:
             return None
 
-    def resolve_tasks(self, info, project_id, status=None, assignee_email=None):
-        queryset = Task.objects.filter(project_id=project_id).select_related('project__organization')
-        
+    def resolve_tasks(self, info, project_id, status=None, assignee_email=None, first=None, after=None):
+        queryset = optimize(Task.objects.filter(project_id=project_id), info, {
+            'project': ('select', 'project'),
+            'organization': ('select', 'project__organization'),
+            'comments': ('prefetch', 'comments'),
+        }, defer_unrequested={'description': 'description'}).annotate(
+            _comment_count=Count('comments'),
+            _is_overdue=Case(
+                When(Q(due_date__lt=timezone.now()) & ~Q(status='DONE'), then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField()
+            )
+        )
+
         if status:
             queryset = queryset.filter(status=status)
-        
+
         if assignee_email:
             queryset = queryset.filter(assignee_email=assignee_email)
-        
-        return queryset.prefetch_related('comments')
+
+        if first is not None or after:
+            queryset = _paginate_by_created_at(queryset, first, after)
+
+        return stream(queryset)
 
     def resolve_task(self, info, id):
         try:
-            return Task.objects.select_related('project__organization').prefetch_related('comments').get(id=id)
+            return optimize(Task.objects.all(), info, {
+                'project': ('select', 'project'),
+                'organization': ('select', 'project__organization'),
+                'comments': ('prefetch', 'comments'),
+            }).get(id=id)
         except Task.DoesNotExist:
             return None
 
     def resolve_task_comments(self, info, task_id):
-        return TaskComment.objects.filter(task_id=task_id).select_related('task__project__organization')
+        return stream(optimize(TaskComment.objects.filter(task_id=task_id), info, {
+            'task': ('select', 'task'),
+            'organization': ('select', 'task__project__organization'),
+        }))
 
     def resolve_project_statistics(self, info, organization_slug):
-        try:
-            org = Organization.objects.get(slug=organization_slug)
-        except Organization.DoesNotExist:
+        # Project and task aggregates in a single scan; project counts need
+        # distinct=True since the task join multiplies project rows.
+        stats = Organization.objects.filter(slug=organization_slug).annotate(
+            total=Count('projects', distinct=True),
+            active=Count('projects', filter=Q(projects__status='ACTIVE'), distinct=True),
+            completed=Count('projects', filter=Q(projects__status='COMPLETED'), distinct=True),
+            on_hold=Count('projects', filter=Q(projects__status='ON_HOLD'), distinct=True),
+            total_tasks=Count('projects__tasks'),
+            completed_tasks=Count('projects__tasks', filter=Q(projects__tasks__status='DONE'))
+        ).values('total', 'active', 'completed', 'on_hold', 'total_tasks', 'completed_tasks').first()
+
+        if stats is None:
             raise Exception("Organization not found")
 
-        projects = Project.objects.filter(organization=org)
-        
-        # Project statistics
-        project_stats = projects.aggregate(
-            total=Count('id'),
-            active=Count(Case(When(status='ACTIVE', then=1), output_field=IntegerField())),
-            completed=Count(Case(When(status='COMPLETED', then=1), output_field=IntegerField())),
-            on_hold=Count(Case(When(status='ON_HOLD', then=1), output_field=IntegerField()))
-        )
-        
-        # Task statistics
-        tasks = Task.objects.filter(project__organization=org)
-        task_stats = tasks.aggregate(
-            total_tasks=Count('id'),
-            completed_tasks=Count(Case(When(status='DONE', then=1), output_field=IntegerField()))
-        )
-        
         completion_rate = 0
-        if task_stats['total_tasks'] > 0:
-            completion_rate = round((task_stats['completed_tasks'] / task_stats['total_tasks']) * 100, 1)
+        if stats['total_tasks'] > 0:
+            completion_rate = round((stats['completed_tasks'] / stats['total_tasks']) * 100, 1)
 
         return ProjectStatisticsType(
-            total_projects=project_stats['total'],
-            active_projects=project_stats['active'],
-            completed_projects=project_stats['completed'],
-            on_hold_projects=project_stats['on_hold'],
-            total_tasks=task_stats['total_tasks'],
-            completed_tasks=task_stats['completed_tasks'],
+            total_projects=stats['total'],
+            active_projects=stats['active'],
+            completed_projects=stats['completed'],
+            on_hold_projects=stats['on_hold'],
+            total_tasks=stats['total_tasks'],
+            completed_tasks=stats['completed_tasks'],
             completion_rate=completion_rate
         )
 
     def resolve_project_status_choices(self, info):
-        return [StatusChoiceType(value=choice[0], display=choice[1]) for choice in STATUS_CHOICES]
+        return _PROJECT_STATUS_CHOICE_OBJS
 
     def resolve_task_status_choices(self, info):
-        return [StatusChoiceType(value=choice[0], display=choice[1]) for choice in TASK_STATUS_CHOICES]
+        return _TASK_STATUS_CHOICE_OBJS
 
 
 # ----------------------
@@ -293,26 +550,26 @@ class CreateOrganization(graphene.Mutation):
         
         # Validation
         try:
-            validate_email(input.contact_email)
+            _email_validator(input.contact_email)
         except ValidationError:
             errors.append("Invalid email format")
 
-        slug = slugify(input.name.lower())
+        slug = slugify(input.name)  # slugify lowercases already
 
-        if Organization.objects.filter(slug=slug).exists():
-            errors.append("Organization with this slug already exists")
-        
         if errors:
             return CreateOrganization(success=False, errors=errors)
 
+        # Rely on the unique constraint instead of a pre-check query; this
+        # saves a round-trip and is race-free.
         try:
-            with transaction.atomic():
-                org = Organization.objects.create(
-                    name=input.name,
-                    slug=slug,
-                    contact_email=input.contact_email
-                )
-                return CreateOrganization(organization=org, success=True, errors=[])
+            org = Organization.objects.create(
+                name=input.name,
+                slug=slug,
+                contact_email=input.contact_email
+            )
+            return CreateOrganization(organization=org, success=True, errors=[])
+        except IntegrityError:
+            return CreateOrganization(success=False, errors=["Organization with this slug already exists"])
         except Exception as e:
             return CreateOrganization(success=False, errors=[str(e)])
 
@@ -328,29 +585,28 @@ class CreateProject(graphene.Mutation):
     def mutate(self, info, input):
         errors = []
         
-        try:
-            org = Organization.objects.get(id=input.organization_id)
-        except Organization.DoesNotExist:
+        # Cheap index-only existence probe; the create assigns the FK id
+        # directly instead of fetching the full organization row.
+        if not Organization.objects.filter(id=input.organization_id).exists():
             errors.append("Organization not found")
             return CreateProject(success=False, errors=errors)
 
         # Validate status
-        if input.status and input.status not in [choice[0] for choice in STATUS_CHOICES]:
+        if input.status and input.status not in _PROJECT_STATUS_SET:
             errors.append("Invalid status choice")
 
         if errors:
             return CreateProject(success=False, errors=errors)
 
         try:
-            with transaction.atomic():
-                project = Project.objects.create(
-                    organization=org,
-                    name=input.name,
-                    description=input.description or "",
-                    status=input.status or "ACTIVE",
-                    due_date=input.due_date
-                )
-                return CreateProject(project=project, success=True, errors=[])
+            project = Project.objects.create(
+                organization_id=input.organization_id,
+                name=input.name,
+                description=input.description or "",
+                status=input.status or "ACTIVE",
+                due_date=input.due_date
+            )
+            return CreateProject(project=project, success=True, errors=[])
         except Exception as e:
             return CreateProject(success=False, errors=[str(e)])
 
@@ -366,20 +622,18 @@ class CreateTask(graphene.Mutation):
     def mutate(self, info, input):
         errors = []
         
-        try:
-            project = Project.objects.get(id=input.project_id)
-        except Project.DoesNotExist:
+        if not Project.objects.filter(id=input.project_id).exists():
             errors.append("Project not found")
             return CreateTask(success=False, errors=errors)
 
         # Validate status
-        if input.status and input.status not in [choice[0] for choice in TASK_STATUS_CHOICES]:
+        if input.status and input.status not in _TASK_STATUS_SET:
             errors.append("Invalid status choice")
 
         # Validate email
         if input.assignee_email:
             try:
-                validate_email(input.assignee_email)
+                _email_validator(input.assignee_email)
             except ValidationError:
                 errors.append("Invalid assignee email format")
 
@@ -387,16 +641,15 @@ class CreateTask(graphene.Mutation):
             return CreateTask(success=False, errors=errors)
 
         try:
-            with transaction.atomic():
-                task = Task.objects.create(
-                    project=project,
-                    title=input.title,
-                    description=input.description or "",
-                    status=input.status or "TODO",
-                    assignee_email=input.assignee_email or "",
-                    due_date=input.due_date
-                )
-                return CreateTask(task=task, success=True, errors=[])
+            task = Task.objects.create(
+                project_id=input.project_id,
+                title=input.title,
+                description=input.description or "",
+                status=input.status or "TODO",
+                assignee_email=input.assignee_email or "",
+                due_date=input.due_date
+            )
+            return CreateTask(task=task, success=True, errors=[])
         except Exception as e:
             return CreateTask(success=False, errors=[str(e)])
 
@@ -414,15 +667,13 @@ class CreateTaskComment(graphene.Mutation):
     def mutate(self, info, task_id, content, author_email):
         errors = []
         
-        try:
-            task = Task.objects.get(id=task_id)
-        except Task.DoesNotExist:
+        if not Task.objects.filter(id=task_id).exists():
             errors.append("Task not found")
             return CreateTaskComment(success=False, errors=errors)
 
         # Validate email
         try:
-            validate_email(author_email)
+            _email_validator(author_email)
         except ValidationError:
             errors.append("Invalid author email format")
 
@@ -433,13 +684,12 @@ class CreateTaskComment(graphene.Mutation):
             return CreateTaskComment(success=False, errors=errors)
 
         try:
-            with transaction.atomic():
-                comment = TaskComment.objects.create(
-                    task=task,
-                    content=content.strip(),
-                    author_email=author_email
-                )
-                return CreateTaskComment(comment=comment, success=True, errors=[])
+            comment = TaskComment.objects.create(
+                task_id=task_id,
+                content=content.strip(),
+                author_email=author_email
+            )
+            return CreateTaskComment(comment=comment, success=True, errors=[])
         except Exception as e:
             return CreateTaskComment(success=False, errors=[str(e)])
 
@@ -469,25 +719,32 @@ class UpdateProject(graphene.Mutation):
             return UpdateProject(success=False, errors=errors)
 
         # Validate status
-        if status and status not in [choice[0] for choice in STATUS_CHOICES]:
+        if status and status not in _PROJECT_STATUS_SET:
             errors.append("Invalid status choice")
 
         if errors:
             return UpdateProject(success=False, errors=errors)
 
         try:
-            with transaction.atomic():
-                if name is not None:
-                    project.name = name
-                if description is not None:
-                    project.description = description
-                if status is not None:
-                    project.status = status
-                if due_date is not None:
-                    project.due_date = due_date
-
-                project.save()
-                return UpdateProject(project=project, success=True, errors=[])
+            changed = []
+            if name is not None:
+                project.name = name
+                changed.append('name')
+            if description is not None:
+                project.description = description
+                changed.append('description')
+            if status is not None:
+                project.status = status
+                changed.append('status')
+            if due_date is not None:
+                project.due_date = due_date
+                changed.append('due_date')
+
+            if changed:
+                # auto_now fields only refresh when listed in update_fields.
+                changed.append('updated_at')
+            project.save(update_fields=changed or None)
+            return UpdateProject(project=project, success=True, errors=[])
         except Exception as e:
             return UpdateProject(success=False, errors=[str(e)])
 
@@ -515,13 +772,13 @@ class UpdateTask(graphene.Mutation):
             return UpdateTask(success=False, errors=errors)
 
         # Validate status
-        if status and status not in [choice[0] for choice in TASK_STATUS_CHOICES]:
+        if status and status not in _TASK_STATUS_SET:
             errors.append("Invalid status choice")
 
         # Validate email
         if assignee_email:
             try:
-                validate_email(assignee_email)
+                _email_validator(assignee_email)
             except ValidationError:
                 errors.append("Invalid assignee email format")
 
@@ -529,20 +786,27 @@ class UpdateTask(graphene.Mutation):
             return UpdateTask(success=False, errors=errors)
 
         try:
-            with transaction.atomic():
-                if title is not None:
-                    task.title = title
-                if description is not None:
-                    task.description = description
-                if status is not None:
-                    task.status = status
-                if assignee_email is not None:
-                    task.assignee_email = assignee_email
-                if due_date is not None:
-                    task.due_date = due_date
-
-                task.save()
-                return UpdateTask(task=task, success=True, errors=[])
+            changed = []
+            if title is not None:
+                task.title = title
+                changed.append('title')
+            if description is not None:
+                task.description = description
+                changed.append('description')
+            if status is not None:
+                task.status = status
+                changed.append('status')
+            if assignee_email is not None:
+                task.assignee_email = assignee_email
+                changed.append('assignee_email')
+            if due_date is not None:
+                task.due_date = due_date
+                changed.append('due_date')
+
+            if changed:
+                changed.append('updated_at')
+            task.save(update_fields=changed or None)
+            return UpdateTask(task=task, success=True, errors=[])
         except Exception as e:
             return UpdateTask(success=False, errors=[str(e)])
 